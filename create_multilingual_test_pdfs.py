@@ -1,345 +1,278 @@
 #!/usr/bin/env python3
 """
 Create test PDFs with Spanish and English content for OCR multiple language testing.
+
+The documents are plain Helvetica text, so they are written by a small
+built-in PDF generator rather than reportlab.
 """
 
 import os
 
-try:
-    from reportlab.pdfgen import canvas
-    from reportlab.lib.pagesizes import letter
-    from reportlab.pdfbase import pdfmetrics
-    from reportlab.pdfbase.ttfonts import TTFont
-except ImportError:
-    print("reportlab not installed. Please install it with: pip install reportlab")
-    print("Creating simple text files as fallback...")
-    
-    def create_simple_multilingual_files():
-        """Create simple text files as a fallback"""
-        test_dir = "frontend/test_data/multilingual"
-        os.makedirs(test_dir, exist_ok=True)
-        
-        # Spanish content
-        spanish_content = """Hola mundo, este es un documento en español.
-Este documento contiene texto en español para probar el reconocimiento óptico de caracteres.
-Las palabras incluyen acentos como café, niño, comunicación y corazón.
-También incluye números como 123, 456 y fechas como 15 de marzo de 2024.
-El sistema OCR debe reconocer correctamente este contenido en español."""
+# US Letter, in points
+PAGE_WIDTH, PAGE_HEIGHT = 612, 792
 
-        # English content
-        english_content = """Hello world, this is an English document.
-This document contains English text for optical character recognition testing.
-The words include common English vocabulary and technical terms.
-It also includes numbers like 123, 456 and dates like March 15, 2024.
-The OCR system should correctly recognize this English content."""
+# Spanish test PDF body
+_SPANISH_LINES = (
+    "Hola mundo, este es un documento en español.",
+    "",
+    "Este documento contiene texto en español para probar",
+    "el reconocimiento óptico de caracteres (OCR).",
+    "",
+    "Las palabras incluyen acentos como:",
+    "• café, niño, comunicación, corazón",
+    "• también, habitación, compañía",
+    "• informática, educación, investigación",
+    "",
+    "Números y fechas en español:",
+    "• 123 ciento veintitrés",
+    "• 456 cuatrocientos cincuenta y seis",
+    "• 15 de marzo de 2024",
+    "• 31 de diciembre de 2023",
+    "",
+    "Frases comunes:",
+    "Por favor, muchas gracias, de nada.",
+    "¿Cómo está usted? Muy bien, gracias.",
+    "Buenos días, buenas tardes, buenas noches.",
+    "",
+    "El sistema OCR debe reconocer correctamente",
+    "todo este contenido en español, incluyendo",
+    "los caracteres especiales y acentos.",
+)
 
-        # Mixed content
-        mixed_content = """Documento bilingüe / Bilingual Document
+# English test PDF body
+_ENGLISH_LINES = (
+    "Hello world, this is an English document.",
+    "",
+    "This document contains English text for testing",
+    "optical character recognition (OCR) capabilities.",
+    "",
+    "Common English words and phrases:",
+    "• technology, computer, software, hardware",
+    "• document, recognition, character, optical",
+    "• testing, validation, verification, quality",
+    "",
+    "Numbers and dates in English:",
+    "• 123 one hundred twenty-three",
+    "• 456 four hundred fifty-six",
+    "• March 15, 2024",
+    "• December 31, 2023",
+    "",
+    "Common phrases:",
+    "Please, thank you, you're welcome.",
+    "How are you? I'm fine, thank you.",
+    "Good morning, good afternoon, good evening.",
+    "",
+    "The OCR system should correctly recognize",
+    "all this English content, including proper",
+    "capitalization and punctuation marks.",
+    "",
+    "Technical terms and abbreviations:",
+    "API, REST, JSON, XML, HTTP, HTTPS",
+    "CPU, RAM, SSD, USB, WiFi, Bluetooth",
+)
 
-Sección en español:
-Este es un documento que contiene texto en dos idiomas diferentes.
-El reconocimiento óptico de caracteres debe manejar ambos idiomas.
+# Mixed language PDF body
+_MIXED_LINES = (
+    "Sección en español:",
+    "",
+    "Este es un documento que contiene texto en dos",
+    "idiomas diferentes. El reconocimiento óptico",
+    "de caracteres debe manejar ambos idiomas",
+    "correctamente y sin confusión.",
+    "",
+    "Palabras clave: español, idioma, reconocimiento",
+    "",
+    "English section:",
+    "",
+    "This is a document that contains text in two",
+    "different languages. The optical character",
+    "recognition should handle both languages",
+    "correctly without confusion.",
+    "",
+    "Keywords: English, language, recognition",
+    "",
+    "Conclusión / Conclusion:",
+    "",
+    "Los sistemas modernos de OCR deben ser capaces",
+    "de procesar múltiples idiomas en un solo documento.",
+    "",
+    "Modern OCR systems should be capable of processing",
+    "multiple languages within a single document.",
+)
 
-English section:
-This is a document that contains text in two different languages.
-The optical character recognition should handle both languages."""
+# Complex Spanish document body with special characters
+_COMPLEX_SPANISH_LINES = (
+    "Características especiales del español:",
+    "",
+    "Vocales acentuadas: á, é, í, ó, ú",
+    "Letra eñe: niño, España, año, señor",
+    "Diéresis: pingüino, cigüeña, vergüenza",
+    "",
+    "Signos de puntuación especiales:",
+    "¿Preguntas con signos de apertura?",
+    "¡Exclamaciones con signos de apertura!",
+    "",
+    "Palabras con combinaciones complejas:",
+    "• excelente, exacto, oxígeno",
+    "• desarrollo, rápido, árbol",
+    "• comunicación, administración, información",
+    "",
+    "Números ordinales:",
+    "1º primero, 2º segundo, 3º tercero",
+    "10º décimo, 20º vigésimo, 100º centésimo",
+    "",
+    "Este documento prueba la capacidad del OCR",
+    "para reconocer correctamente todos los",
+    "caracteres especiales del idioma español.",
+)
 
-        with open(f"{test_dir}/spanish_test.txt", "w", encoding="utf-8") as f:
-            f.write(spanish_content)
-        
-        with open(f"{test_dir}/english_test.txt", "w", encoding="utf-8") as f:
-            f.write(english_content)
-            
-        with open(f"{test_dir}/mixed_language_test.txt", "w", encoding="utf-8") as f:
-            f.write(mixed_content)
-        
-        print("Created simple multilingual text files for testing")
-        return True
-    
-    if not create_simple_multilingual_files():
-        exit(1)
-    exit(0)
+# Complex English document body
+_COMPLEX_ENGLISH_LINES = (
+    "Advanced English language features:",
+    "",
+    "Contractions: don't, won't, can't, isn't",
+    "Possessives: user's, system's, company's",
+    "Hyphenated words: state-of-the-art, well-known",
+    "",
+    "Technical terminology:",
+    "• machine learning, artificial intelligence",
+    "• natural language processing, deep learning",
+    "• computer vision, pattern recognition",
+    "",
+    "Abbreviations and acronyms:",
+    "• CEO, CTO, API, SDK, IDE, URL",
+    "• HTML, CSS, JavaScript, TypeScript",
+    "• REST, GraphQL, JSON, XML, YAML",
+    "",
+    "Numbers and measurements:",
+    "• 3.14159 (pi), 2.71828 (e)",
+    "• 100%, 50°F, 25°C, $1,000.00",
+    "• 1st, 2nd, 3rd, 21st century",
+    "",
+    "This document tests the OCR system's ability",
+    "to recognize complex English text patterns",
+    "including technical terms and formatting.",
+)
 
-def create_multilingual_test_pdfs():
-    """Create test PDFs with Spanish and English content"""
-    test_dir = "frontend/test_data/multilingual"
-    os.makedirs(test_dir, exist_ok=True)
-    
-    # Spanish test PDF
-    pdf_path = f"{test_dir}/spanish_test.pdf"
-    c = canvas.Canvas(pdf_path, pagesize=letter)
-    width, height = letter
-    
-    # Spanish content
-    c.setFont("Helvetica", 14)
-    y_position = height - 80
-    
-    # Title
-    c.drawString(72, y_position, "Documento de Prueba en Español")
-    y_position -= 40
-    
-    c.setFont("Helvetica", 12)
-    spanish_lines = [
-        "Hola mundo, este es un documento en español.",
-        "",
-        "Este documento contiene texto en español para probar",
-        "el reconocimiento óptico de caracteres (OCR).",
-        "",
-        "Las palabras incluyen acentos como:",
-        "• café, niño, comunicación, corazón",
-        "• también, habitación, compañía",
-        "• informática, educación, investigación",
-        "",
-        "Números y fechas en español:",
-        "• 123 ciento veintitrés",
-        "• 456 cuatrocientos cincuenta y seis", 
-        "• 15 de marzo de 2024",
-        "• 31 de diciembre de 2023",
-        "",
-        "Frases comunes:",
-        "Por favor, muchas gracias, de nada.",
-        "¿Cómo está usted? Muy bien, gracias.",
-        "Buenos días, buenas tardes, buenas noches.",
-        "",
-        "El sistema OCR debe reconocer correctamente",
-        "todo este contenido en español, incluyendo",
-        "los caracteres especiales y acentos.",
-    ]
-    
-    for line in spanish_lines:
-        if line:
-            c.drawString(72, y_position, line)
-        y_position -= 18
+# (filename, title, lines) for each generated PDF
+_DOCUMENTS = (
+    ("spanish_test.pdf", "Documento de Prueba en Español", _SPANISH_LINES),
+    ("english_test.pdf", "English Test Document", _ENGLISH_LINES),
+    ("mixed_language_test.pdf", "Documento Bilingüe / Bilingual Document", _MIXED_LINES),
+    ("spanish_complex.pdf", "Documento Español Complejo", _COMPLEX_SPANISH_LINES),
+    ("english_complex.pdf", "Complex English Document", _COMPLEX_ENGLISH_LINES),
+)
+
+def _pdf_string(text):
+    """Encode text as a PDF literal string in WinAnsiEncoding"""
+    escaped = text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+    # Keep the content stream ASCII by octal-escaping the accented bytes
+    return b"(" + b"".join(
+        bytes((byte,)) if byte < 0x80 else b"\\%03o" % byte
+        for byte in escaped.encode("cp1252")
+    ) + b")"
+
+def _paginate(lines):
+    """Split body lines into pages, starting a new page below y = 50"""
+    pages = [[]]
+    y_position = PAGE_HEIGHT - 120
+    for line in lines:
         if y_position < 50:  # Start new page if needed
-            c.showPage()
-            y_position = height - 50
-    
-    c.save()
-    print(f"Created: {pdf_path}")
-    
-    # English test PDF
-    pdf_path = f"{test_dir}/english_test.pdf"
-    c = canvas.Canvas(pdf_path, pagesize=letter)
-    
-    c.setFont("Helvetica", 14)
-    y_position = height - 80
-    
-    # Title
-    c.drawString(72, y_position, "English Test Document")
-    y_position -= 40
-    
-    c.setFont("Helvetica", 12)
-    english_lines = [
-        "Hello world, this is an English document.",
-        "",
-        "This document contains English text for testing",
-        "optical character recognition (OCR) capabilities.",
-        "",
-        "Common English words and phrases:",
-        "• technology, computer, software, hardware",
-        "• document, recognition, character, optical",
-        "• testing, validation, verification, quality",
-        "",
-        "Numbers and dates in English:",
-        "• 123 one hundred twenty-three",
-        "• 456 four hundred fifty-six",
-        "• March 15, 2024",
-        "• December 31, 2023",
-        "",
-        "Common phrases:",
-        "Please, thank you, you're welcome.",
-        "How are you? I'm fine, thank you.",
-        "Good morning, good afternoon, good evening.",
-        "",
-        "The OCR system should correctly recognize",
-        "all this English content, including proper",
-        "capitalization and punctuation marks.",
-        "",
-        "Technical terms and abbreviations:",
-        "API, REST, JSON, XML, HTTP, HTTPS",
-        "CPU, RAM, SSD, USB, WiFi, Bluetooth",
-    ]
-    
-    for line in english_lines:
-        if line:
-            c.drawString(72, y_position, line)
+            pages.append([])
+            y_position = PAGE_HEIGHT - 50
+        pages[-1].append(line)
         y_position -= 18
-        if y_position < 50:
-            c.showPage()
-            y_position = height - 50
-    
-    c.save()
-    print(f"Created: {pdf_path}")
-    
-    # Mixed language PDF
-    pdf_path = f"{test_dir}/mixed_language_test.pdf"
-    c = canvas.Canvas(pdf_path, pagesize=letter)
-    
-    c.setFont("Helvetica", 14)
-    y_position = height - 80
-    
-    # Title
-    c.drawString(72, y_position, "Documento Bilingüe / Bilingual Document")
-    y_position -= 40
-    
-    c.setFont("Helvetica", 12)
-    mixed_lines = [
-        "Sección en español:",
-        "",
-        "Este es un documento que contiene texto en dos",
-        "idiomas diferentes. El reconocimiento óptico",
-        "de caracteres debe manejar ambos idiomas",
-        "correctamente y sin confusión.",
-        "",
-        "Palabras clave: español, idioma, reconocimiento",
-        "",
-        "English section:",
-        "",
-        "This is a document that contains text in two", 
-        "different languages. The optical character",
-        "recognition should handle both languages",
-        "correctly without confusion.",
-        "",
-        "Keywords: English, language, recognition",
-        "",
-        "Conclusión / Conclusion:",
-        "",
-        "Los sistemas modernos de OCR deben ser capaces",
-        "de procesar múltiples idiomas en un solo documento.",
-        "",
-        "Modern OCR systems should be capable of processing",
-        "multiple languages within a single document.",
-    ]
-    
-    for line in mixed_lines:
-        if line:
-            c.drawString(72, y_position, line)
-        y_position -= 18
-        if y_position < 50:
-            c.showPage()
-            y_position = height - 50
-    
-    c.save()
-    print(f"Created: {pdf_path}")
-    
-    # Complex Spanish document with special characters
-    pdf_path = f"{test_dir}/spanish_complex.pdf"
-    c = canvas.Canvas(pdf_path, pagesize=letter)
-    
-    c.setFont("Helvetica", 14)
-    y_position = height - 80
-    
-    c.drawString(72, y_position, "Documento Español Complejo")
-    y_position -= 40
-    
-    c.setFont("Helvetica", 12)
-    complex_spanish_lines = [
-        "Características especiales del español:",
-        "",
-        "Vocales acentuadas: á, é, í, ó, ú",
-        "Letra eñe: niño, España, año, señor",
-        "Diéresis: pingüino, cigüeña, vergüenza",
-        "",
-        "Signos de puntuación especiales:",
-        "¿Preguntas con signos de apertura?",
-        "¡Exclamaciones con signos de apertura!",
-        "",
-        "Palabras con combinaciones complejas:",
-        "• excelente, exacto, oxígeno",
-        "• desarrollo, rápido, árbol",
-        "• comunicación, administración, información",
-        "",
-        "Números ordinales:",
-        "1º primero, 2º segundo, 3º tercero",
-        "10º décimo, 20º vigésimo, 100º centésimo",
-        "",
-        "Este documento prueba la capacidad del OCR",
-        "para reconocer correctamente todos los",
-        "caracteres especiales del idioma español.",
-    ]
-    
-    for line in complex_spanish_lines:
-        if line:
-            c.drawString(72, y_position, line)
-        y_position -= 18
-        if y_position < 50:
-            c.showPage()
-            y_position = height - 50
-    
-    c.save()
-    print(f"Created: {pdf_path}")
-    
-    # Complex English document
-    pdf_path = f"{test_dir}/english_complex.pdf"
-    c = canvas.Canvas(pdf_path, pagesize=letter)
-    
-    c.setFont("Helvetica", 14)
-    y_position = height - 80
-    
-    c.drawString(72, y_position, "Complex English Document")
-    y_position -= 40
-    
-    c.setFont("Helvetica", 12)
-    complex_english_lines = [
-        "Advanced English language features:",
-        "",
-        "Contractions: don't, won't, can't, isn't",
-        "Possessives: user's, system's, company's",
-        "Hyphenated words: state-of-the-art, well-known",
-        "",
-        "Technical terminology:",
-        "• machine learning, artificial intelligence",
-        "• natural language processing, deep learning",
-        "• computer vision, pattern recognition",
-        "",
-        "Abbreviations and acronyms:",
-        "• CEO, CTO, API, SDK, IDE, URL",
-        "• HTML, CSS, JavaScript, TypeScript",
-        "• REST, GraphQL, JSON, XML, YAML",
-        "",
-        "Numbers and measurements:",
-        "• 3.14159 (pi), 2.71828 (e)",
-        "• 100%, 50°F, 25°C, $1,000.00",
-        "• 1st, 2nd, 3rd, 21st century",
-        "",
-        "This document tests the OCR system's ability",
-        "to recognize complex English text patterns",
-        "including technical terms and formatting.",
+    return pages
+
+def _page_content(lines, title=None):
+    """Build one page's content stream as a single BT ... ET text block"""
+    ops = [b"BT"]
+    if title is not None:
+        # The 40pt title leading drops the first body line to height - 120
+        ops.append(b"/F1 14 Tf 40 TL 72 %d Td" % (PAGE_HEIGHT - 80))
+        ops.append(_pdf_string(title) + b" Tj T*")
+        ops.append(b"/F1 12 Tf 18 TL")
+    else:
+        ops.append(b"/F1 12 Tf 18 TL 72 %d Td" % (PAGE_HEIGHT - 50))
+    for line in lines:
+        ops.append(_pdf_string(line) + b" Tj T*" if line else b"T*")
+    ops.append(b"ET")
+    return b"\n".join(ops)
+
+def _render_pdf(pdf_path, title, lines):
+    """Write a titled, single-column Helvetica text PDF"""
+    pages = [
+        _page_content(page_lines, title if index == 0 else None)
+        for index, page_lines in enumerate(_paginate(lines))
     ]
     
-    for line in complex_english_lines:
-        if line:
-            c.drawString(72, y_position, line)
-        y_position -= 18
-        if y_position < 50:
-            c.showPage()
-            y_position = height - 50
-    
-    c.save()
-    print(f"Created: {pdf_path}")
-    
-    print("\n🌍 Multilingual Test Files Summary:")
-    print("=" * 50)
-    
-    # Check file sizes
-    test_files = [
-        "spanish_test.pdf",
-        "english_test.pdf",
-        "mixed_language_test.pdf",
-        "spanish_complex.pdf",
-        "english_complex.pdf"
+    # Objects 1-3 are the catalog, page tree and font; each page then
+    # takes a page object followed by its content stream
+    page_refs = b" ".join(b"%d 0 R" % (4 + 2 * index) for index in range(len(pages)))
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [%s] /Count %d >>" % (page_refs, len(pages)),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
     ]
+    for index, content in enumerate(pages):
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>"
+            % (PAGE_WIDTH, PAGE_HEIGHT, 5 + 2 * index)
+        )
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+    
+    chunks = [b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"]
+    offset = len(chunks[0])
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        chunk = b"%d 0 obj\n%s\nendobj\n" % (number, body)
+        offsets.append(offset)
+        chunks.append(chunk)
+        offset += len(chunk)
+    
+    # Cross-reference entries are fixed 20-byte lines
+    chunks.append(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    chunks.extend(b"%010d 00000 n \n" % position for position in offsets)
+    chunks.append(
+        b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+        % (len(objects) + 1, offset)
+    )
+    
+    # Hand the whole file to the OS in a single write
+    fd = os.open(pdf_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, b"".join(chunks))
+    finally:
+        os.close(fd)
+    return pdf_path
+
+def create_multilingual_test_pdfs(verbose=True):
+    """Create test PDFs with Spanish and English content"""
+    log = print if verbose else (lambda *args, **kwargs: None)
     
-    for filename in test_files:
-        filepath = f"{test_dir}/{filename}"
-        if os.path.exists(filepath):
-            size_bytes = os.path.getsize(filepath)
-            size_kb = size_bytes / 1024
-            print(f"📄 {filename}: {size_kb:.1f} KB ({size_bytes:,} bytes)")
+    test_dir = "frontend/test_data/multilingual"
+    os.makedirs(test_dir, exist_ok=True)
     
-    print(f"\n✅ All multilingual test PDFs created in: {test_dir}/")
-    print("🔤 Languages: Spanish (spa) and English (eng)")
-    print("📝 Ready for OCR multiple language testing!")
+    for filename, title, lines in _DOCUMENTS:
+        pdf_path = _render_pdf(f"{test_dir}/{filename}", title, lines)
+        log(f"Created: {pdf_path}")
+    
+    log("\n🌍 Multilingual Test Files Summary:")
+    log("=" * 50)
+    
+    # Check file sizes (one stat per file)
+    for filename, _, _ in _DOCUMENTS:
+        try:
+            size_bytes = os.stat(f"{test_dir}/{filename}").st_size
+        except FileNotFoundError:
+            continue
+        size_kb = size_bytes / 1024
+        log(f"📄 {filename}: {size_kb:.1f} KB ({size_bytes:,} bytes)")
+    
+    log(f"\n✅ All multilingual test PDFs created in: {test_dir}/")
+    log("🔤 Languages: Spanish (spa) and English (eng)")
+    log("📝 Ready for OCR multiple language testing!")
     return True
 
 if __name__ == "__main__":
@@ -14,8 +14,51 @@ EXIF Orientation values:
 """
 
 import io
+import os
 import struct
-from PIL import Image
+
+# create_asymmetric_image() encoded as a JPEG (quality 95, no EXIF). Embedded
+# so generating the test images needs neither Pillow nor libjpeg; rebuild
+# it with encode_base_jpeg() if the pattern changes.
+_BASE_JPEG = bytes.fromhex(
+    "ffd8ffe000104a46494600010100000100010000ffdb0043000201010101010201010102"
+    "020202020403020202020504040304060506060605060606070908060709070606080b08"
+    "090a0a0a0a0a06080b0c0b0a0c090a0a0affdb004301020202020202050303050a070607"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0affc00011080014002803012200021101031101ffc400"
+    "1f0000010501010101010100000000000000000102030405060708090a0bffc400b51000"
+    "02010303020403050504040000017d010203000411051221314106135161072271143281"
+    "91a1082342b1c11552d1f02433627282090a161718191a25262728292a3435363738393a"
+    "434445464748494a535455565758595a636465666768696a737475767778797a83848586"
+    "8788898a92939495969798999aa2a3a4a5a6a7a8a9aab2b3b4b5b6b7b8b9bac2c3c4c5c6"
+    "c7c8c9cad2d3d4d5d6d7d8d9dae1e2e3e4e5e6e7e8e9eaf1f2f3f4f5f6f7f8f9faffc400"
+    "1f0100030101010101010101010000000000000102030405060708090a0bffc400b51100"
+    "020102040403040705040400010277000102031104052131061241510761711322328108"
+    "144291a1b1c109233352f0156272d10a162434e125f11718191a262728292a3536373839"
+    "3a434445464748494a535455565758595a636465666768696a737475767778797a828384"
+    "85868788898a92939495969798999aa2a3a4a5a6a7a8a9aab2b3b4b5b6b7b8b9bac2c3c4"
+    "c5c6c7c8c9cad2d3d4d5d6d7d8d9dae2e3e4e5e6e7e8e9eaf2f3f4f5f6f7f8f9faffda00"
+    "0c03010002110311003f00f8bebfa19ff821a7fca2d3e177fdc6ff00f4f77f5c5ffc3b1b"
+    "fe0857ff0042cf82bff0efea1ffcb1afa1be066bff00b11fecd9f0b34bf82bf057e29f82"
+    "b45f0ce8be7ff66699ff0009bc573e4f9d3c93c9fbc9e7791b32cb237ccc71bb0300003f"
+    "27e12cbf0b90e653c46231b41c5c1c7dda89bbb717d52d343fab3e90bf4aaf0a3c59e0bc"
+    "3e5194559d3ab4f110aadd59508c79634eac1a4e15ea3e6bd456564ad7d764fd868ae2ff"
+    "00e1a4bf676ffa2f9e0aff00c2a6d3ff008e51ff000d25fb3b7fd17cf057fe15369ffc72"
+    "bf43feddc93fe82a9ffe071ff33f8e3fd65e1cff00a0da5ff8321fe67f3fdff077affca4"
+    "9fc11ff643b4dffd3c6b34565ffc1d93e37f05f8f7fe0a2de0bd63c0de2ed2f5ab48fe0a"
+    "e9d0c975a4ea11dcc6920d5f586285a3620300ca71d70c0f7a2bfdaefa3ed5a55fc17c92"
+    "a5292945d05669dd3d65b347c8e3abd0c4e2e7568c94a2de8d34d3f46b467d4b451457fc"
+    "8b1fe4e051451401f9a1ff000595ff00939ed07fec42b5ff00d2dbda28a2bfeabbe85fff"
+    "0028b3c27ff6091ffd2a47fa2fe157fc9bbcb7febdafcd9fffd9"
+)
+
+
+# Little-endian TIFF header followed by IFD0 holding a single Orientation
+# entry, packed in one call. Fields: byte order ("II"), magic (42), offset
+# to first IFD (8), entry count, tag ID, type, count, value + padding, and
+# next IFD offset.
+_TIFF_ORIENTATION_IFD = struct.Struct("<2sHIHHHIHHI")
+_APP1_LENGTH = struct.Struct(">H")
 
 
 def create_asymmetric_image():
@@ -27,24 +70,33 @@ def create_asymmetric_image():
     - Green strip on bottom edge
     This makes it easy to verify orientation transformations.
     """
-    img = Image.new("RGB", (40, 20), color=(255, 255, 255))
+    # Only needed to regenerate _BASE_JPEG, so import lazily
+    import numpy as np
+    from PIL import Image
+
+    arr = np.full((20, 40, 3), 255, dtype=np.uint8)
 
     # Red square in top-left (10x10)
-    for x in range(10):
-        for y in range(10):
-            img.putpixel((x, y), (255, 0, 0))
+    arr[0:10, 0:10] = (255, 0, 0)
 
     # Blue strip on right edge (last 5 columns)
-    for x in range(35, 40):
-        for y in range(20):
-            img.putpixel((x, y), (0, 0, 255))
+    arr[:, 35:40] = (0, 0, 255)
 
     # Green strip on bottom edge (last 5 rows, excluding blue area)
-    for x in range(35):
-        for y in range(15, 20):
-            img.putpixel((x, y), (0, 255, 0))
+    arr[15:20, 0:35] = (0, 255, 0)
+
+    return Image.fromarray(arr)
 
-    return img
+
+def encode_base_jpeg():
+    """
+    Encode the asymmetric image as a JPEG without EXIF, i.e. the bytes
+    embedded as _BASE_JPEG. Regenerate the literal with:
+    python -c "import create_exif_test_images as m; print(m.encode_base_jpeg().hex())"
+    """
+    base_buffer = io.BytesIO()
+    create_asymmetric_image().save(base_buffer, format="JPEG", quality=95)
+    return base_buffer.getvalue()
 
 
 def create_minimal_exif_with_orientation(orientation):
@@ -58,29 +110,12 @@ def create_minimal_exif_with_orientation(orientation):
     - TIFF header
     - IFD0 with Orientation tag
     """
-    # TIFF header (little-endian)
-    tiff_header = b"II"  # Little-endian
-    tiff_header += struct.pack("<H", 42)  # TIFF magic number
-    tiff_header += struct.pack("<I", 8)   # Offset to first IFD
-
-    # IFD0 with one entry (Orientation)
-    ifd = struct.pack("<H", 1)  # Number of entries
-
-    # Orientation tag entry:
-    # Tag ID: 0x0112 (274)
-    # Type: SHORT (3)
-    # Count: 1
-    # Value: orientation
-    ifd += struct.pack("<H", 0x0112)  # Tag ID
-    ifd += struct.pack("<H", 3)       # Type (SHORT)
-    ifd += struct.pack("<I", 1)       # Count
-    ifd += struct.pack("<HH", orientation, 0)  # Value (padded to 4 bytes)
-
-    # Next IFD offset (0 = no more IFDs)
-    ifd += struct.pack("<I", 0)
-
-    # Combine TIFF data
-    tiff_data = tiff_header + ifd
+    tiff_data = _TIFF_ORIENTATION_IFD.pack(
+        b"II", 42, 8,  # Little-endian TIFF header, offset to first IFD
+        1,  # Number of entries
+        0x0112, 3, 1, orientation, 0,  # Orientation tag, SHORT, count 1, padded value
+        0,  # Next IFD offset (0 = no more IFDs)
+    )
 
     # Build APP1 segment
     exif_header = b"Exif\x00\x00"
@@ -88,35 +123,58 @@ def create_minimal_exif_with_orientation(orientation):
     app1_length = len(app1_data) + 2  # +2 for length field itself
 
     app1_segment = b"\xff\xe1"  # APP1 marker
-    app1_segment += struct.pack(">H", app1_length)
+    app1_segment += _APP1_LENGTH.pack(app1_length)
     app1_segment += app1_data
 
     return app1_segment
 
 
-def embed_exif_in_jpeg(jpeg_bytes, exif_segment):
+def split_jpeg(jpeg_bytes):
     """
-    Embed EXIF data into a JPEG image.
-    Insert APP1 segment right after SOI marker.
+    Split a JPEG into its SOI marker and the remaining body, so an EXIF
+    segment can be inserted between them without re-slicing per call.
     """
     # JPEG must start with SOI (0xFFD8)
     if jpeg_bytes[:2] != b"\xff\xd8":
         raise ValueError("Not a valid JPEG file")
 
-    # Insert EXIF APP1 right after SOI
-    return jpeg_bytes[:2] + exif_segment + jpeg_bytes[2:]
+    # Slice through a memoryview so the body is not copied
+    view = memoryview(jpeg_bytes)
+    return view[:2], view[2:]
 
 
-def main():
-    print("Creating test JPEG images with EXIF orientation tags...")
+def embed_exif_in_jpeg(soi, body, exif_segment):
+    """
+    Embed EXIF data into a JPEG image split by split_jpeg().
+    Insert APP1 segment right after SOI marker. The result is returned
+    as a tuple of buffers for write_file() rather than joined.
+    """
+    return (soi, exif_segment, body)
 
-    # Create base image
-    base_img = create_asymmetric_image()
 
-    # Save base image to bytes (no EXIF)
-    base_buffer = io.BytesIO()
-    base_img.save(base_buffer, format="JPEG", quality=95)
-    base_jpeg = base_buffer.getvalue()
+def write_file(filename, parts):
+    """
+    Write a sequence of buffers to filename with a single scatter-gather
+    os.writev, so the parts are never joined into an intermediate copy.
+    Platforms without writev (Windows) fall back to one joined os.write.
+    """
+    fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if hasattr(os, "writev"):
+            os.writev(fd, parts)
+        else:
+            os.write(fd, b"".join(parts))
+    finally:
+        os.close(fd)
+
+
+def main(verbose=True):
+    log = print if verbose else (lambda *args, **kwargs: None)
+
+    log("Creating test JPEG images with EXIF orientation tags...")
+
+    # Base image without EXIF, precomputed by encode_base_jpeg()
+    base_jpeg = _BASE_JPEG
 
     # Generate test images for each orientation value
     orientations = {
@@ -130,21 +188,31 @@ def main():
         8: "rotate_270_cw",
     }
 
-    for orientation, name in orientations.items():
-        exif_segment = create_minimal_exif_with_orientation(orientation)
-        jpeg_with_exif = embed_exif_in_jpeg(base_jpeg, exif_segment)
+    # Split once so each output is a single join of SOI + APP1 + body
+    soi, body = split_jpeg(base_jpeg)
 
-        filename = f"exif_orientation_{orientation}_{name}.jpg"
-        with open(filename, "wb") as f:
-            f.write(jpeg_with_exif)
-        print(f"  Created: {filename} ({len(jpeg_with_exif)} bytes)")
+    # Only the orientation SHORT differs between segments, so build one
+    # template and patch it in place. Offset: marker (2) + length (2) +
+    # "Exif\0\0" (6) + TIFF header (8) + entry count (2) + tag (2) +
+    # type (2) + count (4).
+    exif_template = bytearray(create_minimal_exif_with_orientation(1))
+    orientation_offset = 28
+
+    outputs = []
+    for orientation, name in orientations.items():
+        exif_template[orientation_offset:orientation_offset + 2] = struct.pack("<H", orientation)
+        # Snapshot the segment, as the template is patched again next pass
+        parts = embed_exif_in_jpeg(soi, body, bytes(exif_template))
+        outputs.append((f"exif_orientation_{orientation}_{name}.jpg", parts))
 
     # Also create a JPEG without any EXIF for testing fallback
-    with open("exif_orientation_none.jpg", "wb") as f:
-        f.write(base_jpeg)
-    print(f"  Created: exif_orientation_none.jpg ({len(base_jpeg)} bytes)")
+    outputs.append(("exif_orientation_none.jpg", (base_jpeg,)))
+
+    for filename, parts in outputs:
+        write_file(filename, parts)
+        log(f"  Created: {filename} ({sum(map(len, parts))} bytes)")
 
-    print("\nDone! Created 9 test images.")
+    log("\nDone! Created 9 test images.")
 
 
 if __name__ == "__main__":